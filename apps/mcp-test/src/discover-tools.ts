@@ -26,11 +26,13 @@ export async function discoverTools(
   try {
     await client.connect(transport);
     const tools = await client.listTools();
-    await client.close();
 
     return tools.tools.map((tool) => tool.name);
   } catch (error) {
     ui.error(`Failed to discover tools: ${error}`);
     return [];
+  } finally {
+    // Release the transport on failure too so a half-open session is not left behind
+    await client.close().catch(() => {});
   }
 }
@@ -2,7 +2,7 @@ import fs from 'node:fs';
 import os from 'node:os';
 import path from 'node:path';
 import process from 'node:process';
-import { type McpServerConfig, query } from '@anthropic-ai/claude-agent-sdk';
+import type { McpServerConfig } from '@anthropic-ai/claude-agent-sdk';
 import { cli, define } from 'gunshi';
 import { description, version } from '../package.json';
 import { discoverTools } from './discover-tools';
@@ -53,10 +53,19 @@ const command = define({
       ui.info('Using custom headers');
     }
 
+    // Resolve the Claude executable while tools are being discovered
+    const claudeExecutable = process.env.CLAUDE_CODE_PATH
+      ? Promise.resolve(process.env.CLAUDE_CODE_PATH)
+      : which('claude');
+
     ui.section('Spinning up an MCP Client');
     const spinner = ui.spinner('Connecting to MCP server...');
-    const discoveredTools = await discoverTools(url, headers);
-    spinner.stop();
+    let discoveredTools: string[];
+    try {
+      discoveredTools = await discoverTools(url, headers);
+    } finally {
+      spinner.stop();
+    }
 
     if (discoveredTools.length === 0) {
       ui.error('No tools discovered from the MCP server');
@@ -93,11 +102,16 @@ const command = define({
         },
       };
 
+      // Loaded on demand so --help, --version and early failures skip the SDK import.
+      // Done before the spinner starts so a failed import cannot leave it running
+      const { query } = await import('@anthropic-ai/claude-agent-sdk');
+
       ui.section('Initializing Claude Code SDK');
       const claudeSpinner = ui.spinner('Setting up Claude Code configuration...');
 
-      const pathToClaudeCodeExecutable = process.env.CLAUDE_CODE_PATH ?? which('claude');
+      const pathToClaudeCodeExecutable = await claudeExecutable;
       if (!pathToClaudeCodeExecutable) {
+        claudeSpinner.stop();
         ui.error('Claude Code executable not found');
         process.exit(1);
       }
@@ -197,15 +211,15 @@ const command = define({
       }
 
       // Clean up: remove temp dir
+      ui.section('Cleaning up test environment');
+      const cleanupSpinner = ui.spinner('Cleaning up test environment...');
       try {
-        ui.section('Cleaning up test environment');
-        const cleanupSpinner = ui.spinner('Cleaning up test environment...');
-
         fs.rmSync(tempDir, { recursive: true, force: true });
         cleanupSpinner.stop();
 
         ui.success('Removed temporary directory. Testing complete :)');
       } catch (cleanupError) {
+        cleanupSpinner.stop();
         ui.warning(`Could not clean up temp directory: ${cleanupError}`);
       }
     }
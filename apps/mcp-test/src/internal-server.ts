@@ -107,250 +107,112 @@ const generateTestDataSchema = z.object({
     .describe('Length of data to generate (for strings, words, or numeric strings)'),
 });
 
-// Generate test data function
-async function generateTestData(input: z.infer<typeof generateTestDataSchema>) {
-  const { type, length } = input;
+type TestDataType = z.infer<typeof generateTestDataSchema>['type'];
 
-  try {
-    let data: unknown;
+// Generators keyed by data type, so each call is a single table lookup
+const generators: Record<TestDataType, (length?: number) => unknown> = {
+  // Person
+  email: () => faker.internet.email(),
+  name: () => faker.person.fullName(),
+  fullname: () => faker.person.fullName(),
+  firstName: () => faker.person.firstName(),
+  lastName: () => faker.person.lastName(),
+  username: () => faker.internet.username(),
+  password: () => faker.internet.password(),
+  avatar: () => faker.image.avatar(),
+  jobTitle: () => faker.person.jobTitle(),
 
-    switch (type) {
-      // Person
-      case 'email':
-        data = faker.internet.email();
-        break;
-      case 'name':
-      case 'fullname':
-        data = faker.person.fullName();
-        break;
-      case 'firstName':
-        data = faker.person.firstName();
-        break;
-      case 'lastName':
-        data = faker.person.lastName();
-        break;
-      case 'username':
-        data = faker.internet.username();
-        break;
-      case 'password':
-        data = faker.internet.password();
-        break;
-      case 'avatar':
-        data = faker.image.avatar();
-        break;
-      case 'jobTitle':
-        data = faker.person.jobTitle();
-        break;
+  // Contact
+  phone: () => faker.phone.number(),
+  phoneNumber: () => faker.phone.number(),
 
-      // Contact
-      case 'phone':
-      case 'phoneNumber':
-        data = faker.phone.number();
-        break;
+  // Location
+  address: () => faker.location.streetAddress(true),
+  city: () => faker.location.city(),
+  state: () => faker.location.state(),
+  country: () => faker.location.country(),
+  zipCode: () => faker.location.zipCode(),
+  latitude: () => faker.location.latitude(),
+  longitude: () => faker.location.longitude(),
+  timezone: () => faker.location.timeZone(),
 
-      // Location
-      case 'address':
-        data = faker.location.streetAddress(true);
-        break;
-      case 'city':
-        data = faker.location.city();
-        break;
-      case 'state':
-        data = faker.location.state();
-        break;
-      case 'country':
-        data = faker.location.country();
-        break;
-      case 'zipCode':
-        data = faker.location.zipCode();
-        break;
-      case 'latitude':
-        data = faker.location.latitude();
-        break;
-      case 'longitude':
-        data = faker.location.longitude();
-        break;
-      case 'timezone':
-        data = faker.location.timeZone();
-        break;
+  // Internet
+  url: () => faker.internet.url(),
+  domainName: () => faker.internet.domainName(),
+  ipaddress: () => faker.internet.ip(),
+  ip: () => faker.internet.ip(),
+  ipv6: () => faker.internet.ipv6(),
+  mac: () => faker.internet.mac(),
+  userAgent: () => faker.internet.userAgent(),
+  protocol: () => faker.internet.protocol(),
+  httpMethod: () => faker.internet.httpMethod(),
+  httpStatusCode: () => faker.internet.httpStatusCode(),
 
-      // Internet
-      case 'url':
-        data = faker.internet.url();
-        break;
-      case 'domainName':
-        data = faker.internet.domainName();
-        break;
-      case 'ipaddress':
-      case 'ip':
-        data = faker.internet.ip();
-        break;
-      case 'ipv6':
-        data = faker.internet.ipv6();
-        break;
-      case 'mac':
-        data = faker.internet.mac();
-        break;
-      case 'userAgent':
-        data = faker.internet.userAgent();
-        break;
-      case 'protocol':
-        data = faker.internet.protocol();
-        break;
-      case 'httpMethod':
-        data = faker.internet.httpMethod();
-        break;
-      case 'httpStatusCode':
-        data = faker.internet.httpStatusCode();
-        break;
+  // Identifiers
+  uuid: () => faker.string.uuid(),
+  nanoid: () => faker.string.nanoid(),
+  cuid: () => faker.git.commitSha(), // Using as alternative for cuid
 
-      // Identifiers
-      case 'uuid':
-        data = faker.string.uuid();
-        break;
-      case 'nanoid':
-        data = faker.string.nanoid();
-        break;
-      case 'cuid':
-        data = faker.git.commitSha(); // Using as alternative for cuid
-        break;
+  // Time
+  date: () => faker.date.recent().toISOString(),
+  recentDate: () => faker.date.recent().toISOString(),
+  futureDate: () => faker.date.future().toISOString(),
+  pastDate: () => faker.date.past().toISOString(),
+  birthdate: () => faker.date.birthdate().toISOString(),
+  weekday: () => faker.date.weekday(),
+  month: () => faker.date.month(),
 
-      // Time
-      case 'date':
-        data = faker.date.recent().toISOString();
-        break;
-      case 'recentDate':
-        data = faker.date.recent().toISOString();
-        break;
-      case 'futureDate':
-        data = faker.date.future().toISOString();
-        break;
-      case 'pastDate':
-        data = faker.date.past().toISOString();
-        break;
-      case 'birthdate':
-        data = faker.date.birthdate().toISOString();
-        break;
-      case 'weekday':
-        data = faker.date.weekday();
-        break;
-      case 'month':
-        data = faker.date.month();
-        break;
+  // Numbers
+  number: (length) => faker.number.int({ min: 1, max: length || 1000 }),
+  integer: (length) => faker.number.int({ min: 1, max: length || 1000 }),
+  float: (length) =>
+    faker.number.float({ min: 0, max: length || 1000, fractionDigits: 2 }),
+  bigint: (length) =>
+    faker.number.bigInt({ min: 1n, max: BigInt(length || 1000000) }).toString(),
+  binary: (length) => faker.string.binary({ length: length || 8 }),
+  octal: (length) => faker.string.octal({ length: length || 8 }),
+  hexadecimal: (length) => faker.string.hexadecimal({ length: length || 8 }),
 
-      // Numbers
-      case 'number':
-      case 'integer':
-        data = faker.number.int({ min: 1, max: length || 1000 });
-        break;
-      case 'float':
-        data = faker.number.float({ min: 0, max: length || 1000, fractionDigits: 2 });
-        break;
-      case 'bigint':
-        data = faker.number
-          .bigInt({ min: 1n, max: BigInt(length || 1000000) })
-          .toString();
-        break;
-      case 'binary':
-        data = faker.string.binary({ length: length || 8 });
-        break;
-      case 'octal':
-        data = faker.string.octal({ length: length || 8 });
-        break;
-      case 'hexadecimal':
-        data = faker.string.hexadecimal({ length: length || 8 });
-        break;
-
-      // Text
-      case 'string':
-      case 'text':
-        data = faker.lorem.text();
-        break;
-      case 'word':
-        data = faker.lorem.word();
-        break;
-      case 'words':
-        data = faker.lorem.words(length || 5);
-        break;
-      case 'sentence':
-        data = faker.lorem.sentence();
-        break;
-      case 'paragraph':
-        data = faker.lorem.paragraph(length || 3);
-        break;
-      case 'slug':
-        data = faker.lorem.slug(length || 3);
-        break;
+  // Text
+  string: () => faker.lorem.text(),
+  text: () => faker.lorem.text(),
+  word: () => faker.lorem.word(),
+  words: (length) => faker.lorem.words(length || 5),
+  sentence: () => faker.lorem.sentence(),
+  paragraph: (length) => faker.lorem.paragraph(length || 3),
+  slug: (length) => faker.lorem.slug(length || 3),
 
-      // Business
-      case 'company':
-        data = faker.company.name();
-        break;
-      case 'productName':
-        data = faker.commerce.productName();
-        break;
-      case 'price':
-        data = faker.commerce.price();
-        break;
-      case 'creditCardNumber':
-        data = faker.finance.creditCardNumber();
-        break;
-      case 'iban':
-        data = faker.finance.iban();
-        break;
-      case 'bic':
-        data = faker.finance.bic();
-        break;
-      case 'currencyCode':
-        data = faker.finance.currencyCode();
-        break;
-      case 'currencySymbol':
-        data = faker.finance.currencySymbol();
-        break;
+  // Business
+  company: () => faker.company.name(),
+  productName: () => faker.commerce.productName(),
+  price: () => faker.commerce.price(),
+  creditCardNumber: () => faker.finance.creditCardNumber(),
+  iban: () => faker.finance.iban(),
+  bic: () => faker.finance.bic(),
+  currencyCode: () => faker.finance.currencyCode(),
+  currencySymbol: () => faker.finance.currencySymbol(),
 
-      // Misc
-      case 'boolean':
-        data = faker.datatype.boolean();
-        break;
-      case 'color':
-        data = faker.color.human();
-        break;
-      case 'hexColor':
-        data = faker.color.rgb({ format: 'hex' });
-        break;
-      case 'rgbColor':
-        data = faker.color.rgb();
-        break;
-      case 'emoji':
-        data = faker.internet.emoji();
-        break;
-      case 'fileName':
-        data = faker.system.fileName();
-        break;
-      case 'fileExtension':
-        data = faker.system.fileExt();
-        break;
-      case 'mimeType':
-        data = faker.system.mimeType();
-        break;
-      case 'locale':
-        data = faker.location.countryCode();
-        break;
-      case 'alpha':
-        data = faker.string.alpha({ length: length || 10 });
-        break;
-      case 'alphanumeric':
-        data = faker.string.alphanumeric({ length: length || 10 });
-        break;
-      case 'numeric':
-        data = faker.string.numeric({ length: length || 10 });
-        break;
+  // Misc
+  boolean: () => faker.datatype.boolean(),
+  color: () => faker.color.human(),
+  hexColor: () => faker.color.rgb({ format: 'hex' }),
+  rgbColor: () => faker.color.rgb(),
+  emoji: () => faker.internet.emoji(),
+  fileName: () => faker.system.fileName(),
+  fileExtension: () => faker.system.fileExt(),
+  mimeType: () => faker.system.mimeType(),
+  locale: () => faker.location.countryCode(),
+  alpha: (length) => faker.string.alpha({ length: length || 10 }),
+  alphanumeric: (length) => faker.string.alphanumeric({ length: length || 10 }),
+  numeric: (length) => faker.string.numeric({ length: length || 10 }),
+};
 
-      default:
-        data = faker.lorem.word();
-    }
+// Generate test data function
+function generateTestData(input: z.infer<typeof generateTestDataSchema>) {
+  const { type, length } = input;
 
-    return { data };
+  try {
+    return { data: generators[type](length) };
   } catch (error) {
     return {
       error: `Failed to generate test data: ${error instanceof Error ? error.message : 'Unknown error'}`,
@@ -388,12 +250,12 @@ server.tool(
   },
   async (args: unknown) => {
     const input = generateTestDataSchema.parse(args);
-    const result = await generateTestData(input);
+    const result = generateTestData(input);
     return {
       content: [
         {
           type: 'text',
-          text: JSON.stringify(result, null, 2),
+          text: JSON.stringify(result),
         },
       ],
     };
@@ -1,11 +1,11 @@
 export function createTestingPrompt(tools: string[]): string {
   const toolsList = tools.map((t) => `- ${t}`).join('\n');
 
+  // Static instructions first and the tool list last, so every run shares the same
+  // prompt prefix and can hit the provider prompt cache
   return `You are a model context protocol (mcp) testing agent. You have access to MCP tools.
 
-You should test the following tools from the "server-to-test" server:
-${toolsList}
-
+You should test the tools from the "server-to-test" server listed at the end of this prompt.
 Call each tool with realistic data and test the result. 
 You have access to some helper tools from the "internal-helper" MCP server. This allows you to generate realistic data for the tools in the "server-to-test" server.
 
@@ -36,5 +36,8 @@ The results.json should be a valid JSON file with the following structure:
   ]
 }
 
-Be thorough but efficient. Test each tool once with good representative data.`;
+Be thorough but efficient. Test each tool once with good representative data.
+
+Tools to test from the "server-to-test" server:
+${toolsList}`;
 }
@@ -3,11 +3,17 @@ import chalk from 'chalk';
 import ora, { type Ora } from 'ora';
 import treeify, { type TreeObject } from 'treeify';
 
+// Fixed decorations are rendered once instead of on every call
+const HEADER_RULE = '-'.repeat(50);
+const DETAIL_BULLET = chalk.gray('  *');
+const LIST_BULLET = chalk.gray('    -');
+const DIVIDER = chalk.gray(`  ${'─'.repeat(50)}`);
+
 export const ui = {
   // Headers
   header: (title: string) => {
     console.log();
-    console.log(chalk.cyan.bold(`--- ${title} ${'-'.repeat(50 - title.length)}`));
+    console.log(chalk.cyan.bold(`--- ${title} ${HEADER_RULE.slice(title.length)}`));
     console.log();
   },
 
@@ -27,23 +33,25 @@ export const ui = {
   // Details
   detail: (label: string, value: string | number) => {
     console.log(
-      `${chalk.gray('  *')} ${chalk.bold(`${label}:`)} ${chalk.cyan(String(value))}`
+      `${DETAIL_BULLET} ${chalk.bold(`${label}:`)} ${chalk.cyan(String(value))}`
     );
   },
 
   lastDetail: (label: string, value: string | number) => {
     console.log(
-      `${chalk.gray('  *')} ${chalk.bold(`${label}:`)} ${chalk.cyan(String(value))}`
+      `${DETAIL_BULLET} ${chalk.bold(`${label}:`)} ${chalk.cyan(String(value))}`
     );
   },
 
   // Lists
   list: (items: string[], title?: string) => {
+    // Build the whole list and write it once rather than once per item
+    const lines = items.map((item) => `${LIST_BULLET} ${item}`);
     if (title) {
-      console.log(chalk.blue(`  ${title}:`));
+      lines.unshift(chalk.blue(`  ${title}:`));
     }
-    for (const item of items) {
-      console.log(`${chalk.gray('    -')} ${item}`);
+    if (lines.length > 0) {
+      console.log(lines.join('\n'));
     }
   },
 
@@ -113,8 +121,13 @@ export const ui = {
 
     const processedObj = processValue(obj);
     const tree = treeify.asTree(processedObj as TreeObject, true, false);
-    for (const line of tree.split('\n')) {
-      if (line) console.log(`  ${chalk.gray(line)}`);
+    const lines = tree
+      .split('\n')
+      .filter(Boolean)
+      .map((line) => `  ${chalk.gray(line)}`);
+    if (lines.length > 0) {
+      // One write per tree instead of one per line keeps large tool results fast
+      console.log(lines.join('\n'));
     }
   },
 
@@ -160,13 +173,15 @@ export const ui = {
   // Utilities
   path: (path: string) => chalk.yellow(path),
   newline: () => console.log(),
-  divider: () => console.log(chalk.gray(`  ${'─'.repeat(50)}`)),
+  divider: () => console.log(DIVIDER),
 
   // Spinner
   spinner: (text: string): Ora =>
     ora({
       text,
       spinner: 'dots',
+      // Cap at 10 FPS; the default 80ms dots cadence only adds redraws during long calls
+      interval: 100,
       color: 'cyan',
     }).start(),
 };
@@ -1,16 +1,25 @@
-import childProcess from 'node:child_process';
+import { access, constants, stat } from 'node:fs/promises';
+import path from 'node:path';
 
 /**
- * Synchronously finds the full path of a command in the system's PATH.
+ * Finds the full path of a command in the system's PATH.
+ * Scans PATH directly instead of spawning a `which` subprocess.
+ * Async so callers can resolve it alongside other startup work.
  * not for windows
  */
-export function which(command: string): string | undefined {
-  try {
-    const result = childProcess
-      .execSync(`which ${command}`, { encoding: 'utf-8' })
-      .trim();
-    return result ?? undefined;
-  } catch {
-    return undefined;
+export async function which(command: string): Promise<string | undefined> {
+  for (const dir of (process.env.PATH ?? '').split(path.delimiter)) {
+    if (!dir) continue;
+
+    const candidate = path.join(dir, command);
+    try {
+      await access(candidate, constants.X_OK);
+      if ((await stat(candidate)).isFile()) {
+        return candidate;
+      }
+    } catch {
+      // not present or not executable in this directory
+    }
   }
+  return undefined;
 }
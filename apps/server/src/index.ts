@@ -56,11 +56,13 @@ const customLogger = (
   fileLogger.log(level, message, { ...meta, timestamp });
 };
 
+// Index connectors by key once instead of scanning the list on each lookup
+const connectorsByKey = new Map<string, MCPConnectorConfig>(
+  allConnectors.map((c) => [c.key, c as MCPConnectorConfig])
+);
+
 const getConnectorByKey = (connectorKey: string): MCPConnectorConfig | null => {
-  const connector = allConnectors.find(
-    (c) => c.key === connectorKey
-  ) as MCPConnectorConfig;
-  return connector || null;
+  return connectorsByKey.get(connectorKey) ?? null;
 };
 
 const createRuntimeConnectorContext = (
@@ -100,27 +102,44 @@ const createRuntimeConnectorContext = (
   };
 };
 
+// JSON-RPC error body for the HTTP methods stateless mode does not support
+const METHOD_NOT_ALLOWED_RESPONSE = {
+  jsonrpc: '2.0',
+  error: {
+    code: -32000,
+    message: 'Method not allowed in stateless mode',
+  },
+  id: null,
+} as const;
+
+// Only needed on the usage/error paths, which print it once and exit
+const formatAvailableConnectors = () =>
+  `Available connectors (${allConnectors.length}):\n${allConnectors
+    .map((c) => c.key)
+    .sort()
+    .join(', ')}`;
+
 const printUsage = () => {
-  console.log('🚀 MCP Connector Server');
-  console.log('');
-  console.log('Usage: npm start -- --connector <connector-key> [options]');
-  console.log('');
-  console.log('Options:');
-  console.log('  --connector    Connector key (required)');
-  console.log('  --credentials  JSON string with connector credentials');
-  console.log('  --setup        JSON string with connector setup configuration');
-  console.log('  --port         Port to run server on (default: 3000)');
-  console.log('  --help         Show this help message');
-  console.log('');
-  console.log(`Available connectors (${allConnectors.length}):`);
-  const sortedConnectors = allConnectors.map((c) => c.key).sort();
-  console.log(sortedConnectors.join(', '));
-  console.log('');
-  console.log('Examples:');
-  console.log('  npm start -- --connector test');
-  console.log('  npm start -- --connector asana --credentials \'{"apiKey":"sk-xxx"}\'');
   console.log(
-    '  npm start -- --connector github --credentials \'{"token":"ghp_xxx"}\' --setup \'{"org":"myorg"}\''
+    [
+      '🚀 MCP Connector Server',
+      '',
+      'Usage: npm start -- --connector <connector-key> [options]',
+      '',
+      'Options:',
+      '  --connector    Connector key (required)',
+      '  --credentials  JSON string with connector credentials',
+      '  --setup        JSON string with connector setup configuration',
+      '  --port         Port to run server on (default: 3000)',
+      '  --help         Show this help message',
+      '',
+      formatAvailableConnectors(),
+      '',
+      'Examples:',
+      '  npm start -- --connector test',
+      '  npm start -- --connector asana --credentials \'{"apiKey":"sk-xxx"}\'',
+      '  npm start -- --connector github --credentials \'{"token":"ghp_xxx"}\' --setup \'{"org":"myorg"}\'',
+    ].join('\n')
   );
 };
 
@@ -173,14 +192,7 @@ export const startServer = async (): Promise<{
 
   if (!connectorConfig) {
     console.error(`❌ Connector "${connectorKey}" not found`);
-    console.log('');
-    console.log(`Available connectors (${allConnectors.length}):`);
-    console.log(
-      allConnectors
-        .map((c) => c.key)
-        .sort()
-        .join(', ')
-    );
+    console.log(`\n${formatAvailableConnectors()}`);
     process.exit(1);
   }
 
@@ -213,6 +225,11 @@ export const startServer = async (): Promise<{
 
   const context = createRuntimeConnectorContext(credentials, setup);
 
+  // Tool and resource lists are fixed for the connector, so collect them once
+  // instead of on every stateless request
+  const tools = Object.values(connectorConfig.tools);
+  const resources = Object.values(connectorConfig.resources);
+
   // Function to create a new MCP server instance with configured tools/resources
   const getServer = (): McpServer => {
     const server = new McpServer({
@@ -221,19 +238,19 @@ export const startServer = async (): Promise<{
     });
 
     // Register tools
-    for (const tool of Object.values(connectorConfig.tools)) {
+    for (const tool of tools) {
       server.tool(
         tool.name,
         tool.description,
         // @ts-expect-error - TODO: fix this
         tool.schema.shape,
         async (args: unknown) => {
-          const startTime = Date.now();
+          const startTime = performance.now();
           customLogger(`Tool invoked: ${tool.name}`, 'info', { tool: tool.name, args });
 
           try {
             const result = await tool.handler(args, context);
-            const duration = Date.now() - startTime;
+            const duration = Math.round(performance.now() - startTime);
             customLogger(`Tool completed: ${tool.name} (${duration}ms)`, 'info', {
               tool: tool.name,
               duration,
@@ -243,7 +260,7 @@ export const startServer = async (): Promise<{
               content: [{ type: 'text' as const, text: String(result) }],
             };
           } catch (error) {
-            const duration = Date.now() - startTime;
+            const duration = Math.round(performance.now() - startTime);
             customLogger(`Tool failed: ${tool.name} (${duration}ms)`, 'error', {
               tool: tool.name,
               duration,
@@ -264,9 +281,9 @@ export const startServer = async (): Promise<{
     }
 
     // Register resources
-    for (const resource of Object.values(connectorConfig.resources)) {
+    for (const resource of resources) {
       server.resource(resource.name, resource.uri, async (uri: URL) => {
-        const startTime = Date.now();
+        const startTime = performance.now();
         customLogger(`Resource accessed: ${resource.name}`, 'info', {
           resource: resource.name,
           uri: uri.toString(),
@@ -274,7 +291,7 @@ export const startServer = async (): Promise<{
 
         try {
           const result = await resource.handler(context);
-          const duration = Date.now() - startTime;
+          const duration = Math.round(performance.now() - startTime);
           customLogger(`Resource fetched: ${resource.name} (${duration}ms)`, 'info', {
             resource: resource.name,
             duration,
@@ -290,7 +307,7 @@ export const startServer = async (): Promise<{
             ],
           };
         } catch (error) {
-          const duration = Date.now() - startTime;
+          const duration = Math.round(performance.now() - startTime);
           customLogger(`Resource failed: ${resource.name} (${duration}ms)`, 'error', {
             resource: resource.name,
             duration,
@@ -379,27 +396,13 @@ export const startServer = async (): Promise<{
   // SSE notifications not supported in stateless mode
   app.get('/mcp', async (_req: Request, res: Response) => {
     customLogger('GET request not supported in stateless mode', 'warn');
-    res.status(405).json({
-      jsonrpc: '2.0',
-      error: {
-        code: -32000,
-        message: 'Method not allowed in stateless mode',
-      },
-      id: null,
-    });
+    res.status(405).json(METHOD_NOT_ALLOWED_RESPONSE);
   });
 
   // Session termination not needed in stateless mode
   app.delete('/mcp', async (_req: Request, res: Response) => {
     customLogger('DELETE request not supported in stateless mode', 'warn');
-    res.status(405).json({
-      jsonrpc: '2.0',
-      error: {
-        code: -32000,
-        message: 'Method not allowed in stateless mode',
-      },
-      id: null,
-    });
+    res.status(405).json(METHOD_NOT_ALLOWED_RESPONSE);
   });
 
   const port = Number.parseInt(values.port || '3000', 10);
@@ -408,8 +411,8 @@ export const startServer = async (): Promise<{
   customLogger('Starting MCP Connector Server (Stateless Mode)...', 'info');
   customLogger(`Connector: ${connectorConfig.name} (${connectorConfig.key})`, 'info');
   customLogger(`Version: ${connectorConfig.version}`, 'info');
-  customLogger(`Tools: ${Object.keys(connectorConfig.tools).length}`, 'info');
-  customLogger(`Resources: ${Object.keys(connectorConfig.resources).length}`, 'info');
+  customLogger(`Tools: ${tools.length}`, 'info');
+  customLogger(`Resources: ${resources.length}`, 'info');
   customLogger(`Port: ${port}`, 'info');
   customLogger(`Log file: ${path.join(logsDir, 'server.log')}`, 'info');
 
@@ -7,17 +7,21 @@ import { parseArgs } from 'node:util';
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
 const printUsage = () => {
-  console.log('🚀 MCP Connector Server Spawner');
-  console.log('');
-  console.log('Usage: bun run spawn --connector <connector-key> [options]');
-  console.log('');
-  console.log('Options:');
-  console.log('  --connector    Connector key (required)');
-  console.log('  --credentials  JSON string with connector credentials');
-  console.log('  --setup        JSON string with connector setup configuration');
-  console.log('  --port         Port to run server on (default: 3000)');
-  console.log('  --watch        Enable watch mode for development (default: true)');
-  console.log('  --help         Show this help message');
+  console.log(
+    [
+      '🚀 MCP Connector Server Spawner',
+      '',
+      'Usage: bun run spawn --connector <connector-key> [options]',
+      '',
+      'Options:',
+      '  --connector    Connector key (required)',
+      '  --credentials  JSON string with connector credentials',
+      '  --setup        JSON string with connector setup configuration',
+      '  --port         Port to run server on (default: 3000)',
+      '  --watch        Enable watch mode for development (default: true)',
+      '  --help         Show this help message',
+    ].join('\n')
+  );
 };
 
 const main = async () => {
@@ -112,16 +116,20 @@ const main = async () => {
   const port = values.port || '3000';
   const serverUrl = `http://localhost:${port}/mcp`;
 
-  console.log(`✅ Server spawned with PID: ${serverProcess.pid}`);
-  console.log(`🔗 Server URL: ${serverUrl}`);
-  console.log('');
-  console.log('To view logs:');
-  console.log(`  tail -f ${logFile}`);
-  console.log('');
-  console.log('To stop the server:');
-  console.log(`  kill ${serverProcess.pid}`);
-  console.log('');
-  console.log(serverUrl);
+  console.log(
+    [
+      `✅ Server spawned with PID: ${serverProcess.pid}`,
+      `🔗 Server URL: ${serverUrl}`,
+      '',
+      'To view logs:',
+      `  tail -f ${logFile}`,
+      '',
+      'To stop the server:',
+      `  kill ${serverProcess.pid}`,
+      '',
+      serverUrl,
+    ].join('\n')
+  );
 
   // Write PID to file for later reference
   const pidFile = path.join(logsDir, 'server.pid');
@@ -0,0 +1,149 @@
+import type { MCPToolDefinition } from '@stackone/mcp-config-types';
+import { http, HttpResponse } from 'msw';
+import { setupServer } from 'msw/node';
+import { describe, expect, it, vi } from 'vitest';
+import { createMockConnectorContext } from '../__mocks__/context';
+import { DeepseekConnectorConfig } from './deepseek';
+
+const mockStreamResponse = (content: string) => {
+  const chunk = {
+    id: 'chatcmpl-test',
+    object: 'chat.completion.chunk',
+    created: 0,
+    model: 'deepseek-reasoner',
+    choices: [{ index: 0, delta: { content }, finish_reason: null }],
+  };
+
+  return new HttpResponse(`data: ${JSON.stringify(chunk)}\n\ndata: [DONE]\n\n`, {
+    headers: { 'Content-Type': 'text/event-stream' },
+  });
+};
+
+describe('#DeepseekConnectorConfig', () => {
+  describe('.THINKING', () => {
+    describe('when the question has a cached response', () => {
+      it('returns the cached reasoning', async () => {
+        const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+        const mockContext = createMockConnectorContext({
+          credentials: { apiKey: 'test-api-key' },
+        });
+        mockContext.readCache = vi.fn().mockResolvedValue('cached reasoning');
+
+        const actual = await tool.handler(
+          { question: '  Why is the sky blue?' },
+          mockContext
+        );
+
+        expect(actual).toBe('cached reasoning');
+      });
+    });
+
+    describe('when no API key is configured', () => {
+      it('does not read the cache', async () => {
+        const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+        const mockContext = createMockConnectorContext();
+        mockContext.readCache = vi.fn().mockResolvedValue('cached reasoning');
+
+        const actual = await tool.handler(
+          { question: 'Why is the sky blue?' },
+          mockContext
+        );
+
+        expect(actual).toContain('no DeepSeek API key is configured');
+        expect(mockContext.readCache).not.toHaveBeenCalled();
+      });
+    });
+
+    describe('when questions differ only by surrounding whitespace', () => {
+      it('uses the same cache key', async () => {
+        const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+        const mockContext = createMockConnectorContext({
+          credentials: { apiKey: 'test-api-key' },
+        });
+        mockContext.readCache = vi.fn().mockResolvedValue('cached reasoning');
+
+        await tool.handler({ question: 'Why is the sky blue?' }, mockContext);
+        await tool.handler({ question: '\n Why is the sky blue?  ' }, mockContext);
+
+        const [first, second] = vi.mocked(mockContext.readCache).mock.calls;
+        expect(first?.[0]).toBe(second?.[0]);
+      });
+    });
+
+    describe('when the same question is asked with different API keys', () => {
+      it('uses different cache keys', async () => {
+        const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+        const firstContext = createMockConnectorContext({
+          credentials: { apiKey: 'first-api-key' },
+        });
+        const secondContext = createMockConnectorContext({
+          credentials: { apiKey: 'second-api-key' },
+        });
+        firstContext.readCache = vi.fn().mockResolvedValue('cached reasoning');
+        secondContext.readCache = vi.fn().mockResolvedValue('cached reasoning');
+
+        await tool.handler({ question: 'Why is the sky blue?' }, firstContext);
+        await tool.handler({ question: 'Why is the sky blue?' }, secondContext);
+
+        const firstKey = vi.mocked(firstContext.readCache).mock.calls[0]?.[0];
+        const secondKey = vi.mocked(secondContext.readCache).mock.calls[0]?.[0];
+        expect(firstKey).not.toBe(secondKey);
+      });
+    });
+
+    describe('when the response is not cached', () => {
+      describe('and contains a complete thinking block', () => {
+        it('writes the reasoning to the cache under the digest key', async () => {
+          const server = setupServer(
+            http.post('https://api.deepseek.com/chat/completions', () =>
+              mockStreamResponse('<thinking>Rayleigh scattering</thinking>')
+            )
+          );
+          server.listen();
+
+          const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+          const mockContext = createMockConnectorContext({
+            credentials: { apiKey: 'test-api-key' },
+          });
+
+          const actual = await tool.handler(
+            { question: 'Why is the sky blue?' },
+            mockContext
+          );
+
+          server.close();
+
+          const cacheKey = vi.mocked(mockContext.readCache).mock.calls[0]?.[0];
+          expect(actual).toBe('Rayleigh scattering');
+          expect(cacheKey).toMatch(/^deepseek:[0-9a-f]{64}:v1$/);
+          expect(mockContext.writeCache).toHaveBeenCalledWith(
+            cacheKey,
+            'Rayleigh scattering'
+          );
+        });
+      });
+
+      describe('and has no closing thinking tag', () => {
+        it('does not write to the cache', async () => {
+          const server = setupServer(
+            http.post('https://api.deepseek.com/chat/completions', () =>
+              mockStreamResponse('<thinking>Rayleigh scatter')
+            )
+          );
+          server.listen();
+
+          const tool = DeepseekConnectorConfig.tools.THINKING as MCPToolDefinition;
+          const mockContext = createMockConnectorContext({
+            credentials: { apiKey: 'test-api-key' },
+          });
+
+          await tool.handler({ question: 'Why is the sky blue?' }, mockContext);
+
+          server.close();
+
+          expect(mockContext.writeCache).not.toHaveBeenCalled();
+        });
+      });
+    });
+  });
+});
@@ -1,6 +1,7 @@
 import { mcpConnectorConfig } from '@stackone/mcp-config-types';
 import OpenAI from 'openai';
 import { z } from 'zod';
+import { createClientCache } from '../utils/client-cache';
 
 export type Message = {
   role: 'system' | 'user' | 'assistant';
@@ -9,16 +10,46 @@ export type Message = {
 
 const TAG_START = '<thinking>';
 const TAG_END = '</thinking>';
+const MODEL = 'deepseek-reasoner';
 
-const callDeepseek = async (apiKey: string, messages: Message[]): Promise<string> => {
-  const openai = new OpenAI({
-    baseURL: 'https://api.deepseek.com',
-    apiKey: apiKey,
-  });
+// connector level cache in format <connector-key>:<search-key>:<version>
+// The API key is part of the digest so a cached answer is only served to the key that
+// paid for it
+const getCacheKey = async (apiKey: string, question: string): Promise<string> => {
+  // normalise so whitespace-only or unicode-equivalent edits still hit the cache
+  const normalized = question.normalize('NFC').trim();
+  const digest = await crypto.subtle.digest(
+    'SHA-256',
+    new TextEncoder().encode(`${MODEL}|${apiKey}|${normalized}`)
+  );
+  const hash = Array.from(new Uint8Array(digest), (b) =>
+    b.toString(16).padStart(2, '0')
+  ).join('');
+  return `deepseek:${hash}:v1`;
+};
+
+// Reuse one client (and its HTTP connection pool) per API key
+const clients = createClientCache<OpenAI>();
+
+const getClient = (apiKey: string): OpenAI =>
+  clients.get(
+    apiKey,
+    () =>
+      new OpenAI({
+        baseURL: 'https://api.deepseek.com',
+        apiKey: apiKey,
+      })
+  );
+
+const callDeepseek = async (
+  apiKey: string,
+  messages: Message[]
+): Promise<{ text: string; complete: boolean }> => {
+  const openai = getClient(apiKey);
 
   const stream = await openai.chat.completions.create({
     messages,
-    model: 'deepseek-reasoner',
+    model: MODEL,
     stream: true,
   });
 
@@ -27,13 +58,24 @@ const callDeepseek = async (apiKey: string, messages: Message[]): Promise<string
     const content = chunk.choices[0]?.delta?.content || '';
     if (!content) continue;
 
-    if (fullResponse.includes(TAG_END)) break;
+    // Only the new chunk plus enough overlap for a tag split across chunks can contain
+    // the closing tag; stop reading as soon as it arrives
+    const searchFrom = Math.max(0, fullResponse.length - TAG_END.length + 1);
     fullResponse += content;
+    if (fullResponse.includes(TAG_END, searchFrom)) break;
   }
 
-  const start = fullResponse.indexOf(TAG_START) + TAG_START.length;
+  const start = fullResponse.indexOf(TAG_START);
   const end = fullResponse.indexOf(TAG_END);
-  return fullResponse.slice(start, end).trim();
+  if (start === -1 || end < start) {
+    // no well-formed thinking block; return the raw text and let the caller skip caching
+    return { text: fullResponse.trim(), complete: false };
+  }
+
+  return {
+    text: fullResponse.slice(start + TAG_START.length, end).trim(),
+    complete: true,
+  };
 };
 
 export const DeepseekConnectorConfig = mcpConnectorConfig({
@@ -60,14 +102,33 @@ export const DeepseekConnectorConfig = mcpConnectorConfig({
         question: z.string(),
       }),
       handler: async (args, context) => {
-        console.log('Thinking Tool', { question: args.question });
-
         try {
           const { apiKey } = await context.getCredentials();
-          const text = await callDeepseek(apiKey, [
+          if (!apiKey) {
+            return 'Failed to invoke thinking tool: no DeepSeek API key is configured.';
+          }
+
+          const cacheKey = await getCacheKey(apiKey, args.question);
+
+          try {
+            const cached = await context.readCache(cacheKey);
+            if (cached) return cached;
+          } catch (error) {
+            console.warn('KV cache read error for thinking tool:', error);
+          }
+
+          const { text, complete } = await callDeepseek(apiKey, [
             { role: 'user', content: args.question },
           ]);
-          console.log('Thinking Tool Response', { text });
+
+          if (complete && text) {
+            try {
+              await context.writeCache(cacheKey, text);
+            } catch (error) {
+              console.warn('KV cache write error for thinking tool:', error);
+            }
+          }
+
           return text;
         } catch (error) {
           console.log('Thinking Tool Error', { error });
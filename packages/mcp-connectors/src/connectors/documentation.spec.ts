@@ -1,9 +1,9 @@
 import type { MCPToolDefinition } from '@stackone/mcp-config-types';
 import { http, HttpResponse } from 'msw';
 import { setupServer } from 'msw/node';
-import { describe, expect, it, vi } from 'vitest';
+import { beforeEach, describe, expect, it, vi } from 'vitest';
 import { createMockConnectorContext } from '../__mocks__/context';
-import { DocumentationConnectorConfig } from './documentation';
+import { DocumentationConnectorConfig, clearDocsIndexCache } from './documentation';
 
 describe('#DocumentationConnectorConfig', () => {
   describe('.GET_PROVIDER_KEY', () => {
@@ -57,6 +57,10 @@ describe('#DocumentationConnectorConfig', () => {
   });
 
   describe('.SEARCH_DOCS', () => {
+    beforeEach(() => {
+      clearDocsIndexCache();
+    });
+
     describe('when provider_key does not exist', () => {
       it('returns provider not found error', async () => {
         const tool = DocumentationConnectorConfig.tools.SEARCH_DOCS as MCPToolDefinition;
@@ -169,6 +173,37 @@ describe('#DocumentationConnectorConfig', () => {
       });
     });
 
+    describe('when the same provider is searched again', () => {
+      it('reads the documentation cache only once', async () => {
+        const tool = DocumentationConnectorConfig.tools.SEARCH_DOCS as MCPToolDefinition;
+        const mockContext = createMockConnectorContext();
+        mockContext.readCache = vi.fn().mockResolvedValue('hono routing '.repeat(30));
+
+        await tool.handler({ provider_key: 'hono', query: 'routing' }, mockContext);
+        const actual = await tool.handler(
+          { provider_key: 'hono', query: 'routing' },
+          mockContext
+        );
+
+        expect(actual).toContain('Found');
+        expect(mockContext.readCache).toHaveBeenCalledTimes(1);
+      });
+    });
+
+    describe('when more providers are searched than the index cache holds', () => {
+      it('rebuilds the least recently used index', async () => {
+        const tool = DocumentationConnectorConfig.tools.SEARCH_DOCS as MCPToolDefinition;
+        const mockContext = createMockConnectorContext();
+        mockContext.readCache = vi.fn().mockResolvedValue('routing guide '.repeat(30));
+
+        for (const provider_key of ['hono', 'astro', 'expo', 'hono']) {
+          await tool.handler({ provider_key, query: 'routing' }, mockContext);
+        }
+
+        expect(mockContext.readCache).toHaveBeenCalledTimes(4);
+      });
+    });
+
     describe('when documentation is fetched successfully', () => {
       it('writes fetched text to cache', async () => {
         const sampleText = 'pinecone '.repeat(60);
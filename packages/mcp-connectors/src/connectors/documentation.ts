@@ -1,7 +1,12 @@
 import { mcpConnectorConfig } from '@stackone/mcp-config-types';
 import { z } from 'zod';
 
-import { type AnySearchableObject, createIndex, search } from '../utils/lexical-search';
+import {
+  type AnySearchableObject,
+  type SearchIndex,
+  createIndex,
+  search,
+} from '../utils/lexical-search';
 import { splitTextIntoSmartChunks } from '../utils/text-chunking';
 
 enum DocumentationCategory {
@@ -36,7 +41,8 @@ const documentationProviderSchema = z.object({
 type DocumentationProvider = z.infer<typeof documentationProviderSchema> &
   AnySearchableObject;
 
-const generateProviderExplanation = () => {
+// Derived from the static provider schema, so it is built once at module load
+const PROVIDER_EXPLANATION = (() => {
   const schema = documentationProviderSchema.shape;
   const explanations = Object.entries(schema).map(([key, field]) => {
     const description = field.description || 'No description available';
@@ -53,7 +59,7 @@ For best results, select providers based on name match and relevance to your doc
 ----------
 
 `;
-};
+})();
 
 // Collection of providers mapped to their llms-full.txt endpoints
 const DOCUMENTATION_PROVIDERS: DocumentationProvider[] = [
@@ -284,6 +290,97 @@ const DOCUMENTATION_PROVIDERS: DocumentationProvider[] = [
   },
 ];
 
+// Full provider listing returned when no provider name is given; static, so built once
+const ALL_PROVIDERS_LIST = DOCUMENTATION_PROVIDERS.map(
+  (p) => `- Key: ${p.key}\n- Description: ${p.description}`
+).join('\n----------\n');
+
+// The provider list is static, so its search index is built once and shared
+let providerIndex: Promise<SearchIndex<DocumentationProvider>> | null = null;
+
+const getProviderIndex = (): Promise<SearchIndex<DocumentationProvider>> => {
+  if (!providerIndex) {
+    providerIndex = createIndex(DOCUMENTATION_PROVIDERS, {
+      fields: ['key', 'name', 'description'],
+      maxResults: 10,
+      threshold: 0.1,
+    }).catch((error) => {
+      // allow the next call to retry instead of caching the failure
+      providerIndex = null;
+      throw error;
+    });
+  }
+  return providerIndex;
+};
+
+type DocumentationChunk = { id: string; text: string };
+
+// Chunking and indexing a full llms-full.txt is the slow part of search_docs, so the
+// most recently used indexes are kept in memory. An index is larger than its source
+// text, so the cache is capped by entry count and by total text size to stay well
+// inside a Workers isolate's memory limit
+const DOCS_INDEX_TTL_MS = 60 * 60 * 1000;
+const MAX_CACHED_DOCS_INDEXES = 2;
+const MAX_CACHED_DOCS_TEXT_LENGTH = 4_000_000;
+const docsIndexCache = new Map<
+  string,
+  { index: SearchIndex<DocumentationChunk>; textLength: number; expiresAt: number }
+>();
+let cachedDocsTextLength = 0;
+
+const evictDocsIndex = (providerKey: string) => {
+  const entry = docsIndexCache.get(providerKey);
+  if (!entry) return;
+
+  docsIndexCache.delete(providerKey);
+  cachedDocsTextLength -= entry.textLength;
+};
+
+const getCachedDocsIndex = (providerKey: string) => {
+  const entry = docsIndexCache.get(providerKey);
+  if (!entry) return null;
+
+  evictDocsIndex(providerKey);
+  if (entry.expiresAt <= Date.now()) return null;
+
+  // re-insert so the Map's insertion order tracks recency
+  docsIndexCache.set(providerKey, entry);
+  cachedDocsTextLength += entry.textLength;
+  return entry.index;
+};
+
+const cacheDocsIndex = (
+  providerKey: string,
+  index: SearchIndex<DocumentationChunk>,
+  textLength: number
+) => {
+  evictDocsIndex(providerKey);
+  // documentation too large for the budget on its own is never kept
+  if (textLength > MAX_CACHED_DOCS_TEXT_LENGTH) return;
+
+  docsIndexCache.set(providerKey, {
+    index,
+    textLength,
+    expiresAt: Date.now() + DOCS_INDEX_TTL_MS,
+  });
+  cachedDocsTextLength += textLength;
+
+  while (
+    docsIndexCache.size > MAX_CACHED_DOCS_INDEXES ||
+    cachedDocsTextLength > MAX_CACHED_DOCS_TEXT_LENGTH
+  ) {
+    const oldest = docsIndexCache.keys().next().value;
+    if (oldest === undefined) break;
+    evictDocsIndex(oldest);
+  }
+};
+
+// Lets tests start from an empty cache
+export const clearDocsIndexCache = () => {
+  docsIndexCache.clear();
+  cachedDocsTextLength = 0;
+};
+
 export const DocumentationConnectorConfig = mcpConnectorConfig({
   name: 'Documentation',
   key: 'documentation',
@@ -312,19 +409,10 @@ export const DocumentationConnectorConfig = mcpConnectorConfig({
         try {
           // try be as token efficient as possible
           if (!args.provider_name || args.provider_name.trim() === '') {
-            const providerList = DOCUMENTATION_PROVIDERS.map(
-              (p) => `- Key: ${p.key}\n- Description: ${p.description}`
-            ).join('\n----------\n');
-
-            return `${generateProviderExplanation()}${providerList}`;
+            return `${PROVIDER_EXPLANATION}${ALL_PROVIDERS_LIST}`;
           }
 
-          // create an index
-          const index = await createIndex(DOCUMENTATION_PROVIDERS, {
-            fields: ['key', 'name', 'description'],
-            maxResults: 10,
-            threshold: 0.1,
-          });
+          const index = await getProviderIndex();
 
           // do the search
           const searchResults = await search(index, args.provider_name);
@@ -338,7 +426,7 @@ export const DocumentationConnectorConfig = mcpConnectorConfig({
               `- Key: ${res.item.key}\n- Name: ${res.item.name}\n- Description: ${res.item.description}\n- LlmFullUrl: ${res.item.llmsFullUrl}\n- Category: ${res.item.category}`
           );
 
-          return `${generateProviderExplanation()}Found ${results.length} provider${results.length === 1 ? '' : 's'} matching "${args.provider_name}":\n\n${results.join('\n----------\n')}`;
+          return `${PROVIDER_EXPLANATION}Found ${results.length} provider${results.length === 1 ? '' : 's'} matching "${args.provider_name}":\n\n${results.join('\n----------\n')}`;
         } catch (error) {
           console.error('[get_provider_key] Handler error:', error);
           return `Error getting provider keys: ${error instanceof Error ? error.message : 'Unknown error'}`;
@@ -383,59 +471,63 @@ export const DocumentationConnectorConfig = mcpConnectorConfig({
             return 'Please provide a meaningful search query (at least 2 characters).';
           }
 
-          // Try to get cached documentation first
-          let text: string | null = null;
-
-          // connector level cache in format <connector-key>:<search-key>:<version>
-          const cacheKey = `documentation:${args.provider_key}:v3`;
+          let index = getCachedDocsIndex(provider.key);
 
-          try {
-            text = await context.readCache(cacheKey);
-          } catch (error) {
-            console.warn(`KV cache read error for ${args.provider_key}:`, error);
-          }
+          if (!index) {
+            // Try to get cached documentation first
+            let text: string | null = null;
 
-          // If not cached, fetch from external URL
-          if (!text) {
-            const res = await fetch(provider.llmsFullUrl);
+            // connector level cache in format <connector-key>:<search-key>:<version>
+            const cacheKey = `documentation:${args.provider_key}:v3`;
 
-            if (!res.ok) {
-              return `Error fetching documentation for ${provider.name}: ${res.status} ${res.statusText}`;
+            try {
+              text = await context.readCache(cacheKey);
+            } catch (error) {
+              console.warn(`KV cache read error for ${args.provider_key}:`, error);
             }
 
-            text = await res.text();
+            // If not cached, fetch from external URL
+            if (!text) {
+              const res = await fetch(provider.llmsFullUrl);
 
-            // Cache the fetched documentation (24 hour TTL)
-            if (text && text.length > 100) {
-              try {
-                await context.writeCache(cacheKey, text);
-              } catch (error) {
-                console.warn(`KV cache write error for ${args.provider_key}:`, error);
+              if (!res.ok) {
+                return `Error fetching documentation for ${provider.name}: ${res.status} ${res.statusText}`;
               }
-            }
-          }
 
-          // Search the documentation text
-          const chunks = splitTextIntoSmartChunks(text);
+              text = await res.text();
 
-          if (chunks.length === 0) {
-            return `No content found in ${provider.name} documentation.`;
-          }
+              // Cache the fetched documentation (24 hour TTL)
+              if (text && text.length > 100) {
+                try {
+                  await context.writeCache(cacheKey, text);
+                } catch (error) {
+                  console.warn(`KV cache write error for ${args.provider_key}:`, error);
+                }
+              }
+            }
 
-          // Convert chunks to searchable objects
-          const documents = chunks.map((chunk, index) => ({
-            id: String(index),
-            text: chunk,
-          }));
+            // Search the documentation text
+            const chunks = splitTextIntoSmartChunks(text);
 
-          // Search using our lexical search utility
-          const index = await createIndex(documents, {
-            fields: ['text'],
-            maxResults,
-            threshold: 0.1,
-          });
+            if (chunks.length === 0) {
+              return `No content found in ${provider.name} documentation.`;
+            }
+
+            // Convert chunks to searchable objects
+            const documents: DocumentationChunk[] = chunks.map((chunk, idx) => ({
+              id: String(idx),
+              text: chunk,
+            }));
+
+            // Search using our lexical search utility
+            index = await createIndex(documents, {
+              fields: ['text'],
+              threshold: 0.1,
+            });
+            cacheDocsIndex(provider.key, index, text.length);
+          }
 
-          const searchResults = await search(index, args.query);
+          const searchResults = await search(index, args.query, { maxResults });
 
           if (searchResults.length === 0) {
             return `No relevant documentation found for "${args.query}" in ${provider.name}. Try different search terms.`;
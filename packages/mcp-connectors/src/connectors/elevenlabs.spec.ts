@@ -0,0 +1,46 @@
+import type { MCPToolDefinition } from '@stackone/mcp-config-types';
+import { http, HttpResponse } from 'msw';
+import { setupServer } from 'msw/node';
+import { describe, expect, it } from 'vitest';
+import { createMockConnectorContext } from '../__mocks__/context';
+import { ElevenLabsConnectorConfig } from './elevenlabs';
+
+describe('#ElevenLabsConnectorConfig', () => {
+  describe('.TEXT_TO_SPEECH', () => {
+    describe('when a chunk is larger than one conversion batch', () => {
+      it('returns the whole stream as base64', async () => {
+        const audio = Uint8Array.from({ length: 200_000 }, (_, i) => (i * 7) & 255);
+        const server = setupServer(
+          http.post(
+            'https://api.elevenlabs.io/v1/text-to-speech/:voiceId',
+            () =>
+              new HttpResponse(
+                new ReadableStream({
+                  start(controller) {
+                    // one chunk is larger than a single conversion batch
+                    controller.enqueue(audio.subarray(0, 70_000));
+                    controller.enqueue(audio.subarray(70_000));
+                    controller.close();
+                  },
+                }),
+                { headers: { 'Content-Type': 'audio/mpeg' } }
+              )
+          )
+        );
+        server.listen();
+
+        const tool = ElevenLabsConnectorConfig.tools.TEXT_TO_SPEECH as MCPToolDefinition;
+        const mockContext = createMockConnectorContext({
+          credentials: { apiKey: 'test-api-key' },
+        });
+
+        const actual = JSON.parse(await tool.handler({ text: 'Hello' }, mockContext));
+
+        server.close();
+
+        expect(actual.success).toBe(true);
+        expect(actual.audio_base64).toBe(Buffer.from(audio).toString('base64'));
+      });
+    });
+  });
+});
@@ -66,30 +66,25 @@ const makeElevenLabsRequest = async (
   });
 };
 
+// Keeps String.fromCharCode well under engine argument limits
+const CHAR_CODE_BATCH_SIZE = 0x8000;
+
 // Helper function to convert audio stream to base64
-const streamToBase64 = async (stream: ReadableStream): Promise<string> => {
+const streamToBase64 = async (stream: ReadableStream<Uint8Array>): Promise<string> => {
   const reader = stream.getReader();
-  const chunks: Uint8Array[] = [];
+  const parts: string[] = [];
 
+  // Convert each chunk as it arrives instead of spreading one combined buffer,
+  // which overflows the call stack for longer audio
   while (true) {
     const { done, value } = await reader.read();
     if (done) break;
-    chunks.push(value);
-  }
-
-  // Combine all chunks into a single Uint8Array
-  const totalLength = chunks.reduce((sum, chunk) => sum + chunk.length, 0);
-  const combined = new Uint8Array(totalLength);
-  let offset = 0;
-
-  for (const chunk of chunks) {
-    combined.set(chunk, offset);
-    offset += chunk.length;
+    for (let i = 0; i < value.length; i += CHAR_CODE_BATCH_SIZE) {
+      parts.push(String.fromCharCode(...value.subarray(i, i + CHAR_CODE_BATCH_SIZE)));
+    }
   }
 
-  // Convert to base64
-  const binary = String.fromCharCode(...combined);
-  return btoa(binary);
+  return btoa(parts.join(''));
 };
 
 export const ElevenLabsConnectorConfig = mcpConnectorConfig({
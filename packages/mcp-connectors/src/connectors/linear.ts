@@ -1,6 +1,12 @@
 import { type Issue, type IssueLabel, LinearClient } from '@linear/sdk';
 import { mcpConnectorConfig } from '@stackone/mcp-config-types';
 import { z } from 'zod';
+import { createClientCache } from '../utils/client-cache';
+import { mapWithConcurrency } from '../utils/concurrency';
+
+// Each issue fans out into several relation lookups, so only a few issues are
+// resolved at a time to stay within Linear's rate and complexity limits
+const ISSUE_CONCURRENCY = 5;
 
 class LinearClientWrapper {
   private client: LinearClient;
@@ -145,12 +151,13 @@ class LinearClientWrapper {
       includeArchived: args.includeArchived,
     });
 
-    const issues = [];
-    for (const issue of result.nodes) {
-      const details = await this.getIssueDetails(issue);
-      const labels = await issue.labels();
+    return mapWithConcurrency(result.nodes, ISSUE_CONCURRENCY, async (issue) => {
+      const [details, labels] = await Promise.all([
+        this.getIssueDetails(issue),
+        issue.labels(),
+      ]);
 
-      issues.push({
+      return {
         id: issue.id,
         identifier: issue.identifier,
         title: issue.title,
@@ -161,10 +168,8 @@ class LinearClientWrapper {
         assignee: details.assignee?.name || null,
         labels: labels?.nodes?.map((label: IssueLabel) => label.name) || [],
         url: issue.url,
-      });
-    }
-
-    return issues;
+      };
+    });
   }
 
   async getUserIssues(userId?: string, includeArchived?: boolean, limit?: number) {
@@ -182,10 +187,9 @@ class LinearClientWrapper {
       return [];
     }
 
-    const issues = [];
-    for (const issue of result.nodes) {
+    return mapWithConcurrency(result.nodes, ISSUE_CONCURRENCY, async (issue) => {
       const state = await issue.state;
-      issues.push({
+      return {
         id: issue.id,
         identifier: issue.identifier,
         title: issue.title,
@@ -193,10 +197,8 @@ class LinearClientWrapper {
         priority: issue.priority,
         stateName: state?.name || 'Unknown',
         url: issue.url,
-      });
-    }
-
-    return issues;
+      };
+    });
   }
 
   async addComment(
@@ -276,6 +278,12 @@ class LinearClientWrapper {
   }
 }
 
+// Reuse one Linear client (and its HTTP connection pool) per API key
+const clients = createClientCache<LinearClientWrapper>();
+
+const getClient = (apiKey: string) =>
+  clients.get(apiKey, () => new LinearClientWrapper(apiKey));
+
 export const LinearConnectorConfig = mcpConnectorConfig({
   name: 'Linear',
   key: 'linear',
@@ -308,7 +316,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const result = await client.createIssue(
             args.title,
             args.teamId,
@@ -336,7 +344,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const result = await client.updateIssue(
             args.id,
             args.title,
@@ -380,7 +388,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const issues = await client.searchIssues(args);
 
           return `Found ${issues.length} issues:\n${issues
@@ -417,7 +425,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const issues = await client.getUserIssues(
             args.userId,
             args.includeArchived,
@@ -458,7 +466,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const result = await client.addComment(
             args.issueId,
             args.body,
@@ -478,7 +486,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (_args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const result = await client.getOrganization();
           return JSON.stringify(result, null, 2);
         } catch (error) {
@@ -493,7 +501,7 @@ export const LinearConnectorConfig = mcpConnectorConfig({
       handler: async (_args, context) => {
         try {
           const { apiKey } = await context.getCredentials();
-          const client = new LinearClientWrapper(apiKey);
+          const client = getClient(apiKey);
           const result = await client.getViewer();
           return JSON.stringify(result, null, 2);
         } catch (error) {
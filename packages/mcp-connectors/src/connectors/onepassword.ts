@@ -1,8 +1,22 @@
 import { ItemBuilder, OnePasswordConnect } from '@1password/connect';
 import { mcpConnectorConfig } from '@stackone/mcp-config-types';
 import { z } from 'zod';
+import { createClientCache } from '../utils/client-cache';
 import { createIndex, search } from '../utils/lexical-search';
 
+// Reuse one keep-alive Connect client per server and token, so repeated tool
+// calls share the underlying HTTP connection instead of opening a new one
+const clients = createClientCache<ReturnType<typeof OnePasswordConnect>>();
+
+const getClient = (serverUrl: string, token: string) =>
+  clients.get(`${serverUrl}\n${token}`, () =>
+    OnePasswordConnect({
+      serverURL: serverUrl,
+      token,
+      keepAlive: true,
+    })
+  );
+
 export const OnePasswordConnectorConfig = mcpConnectorConfig({
   name: '1Password',
   key: '1password',
@@ -29,11 +43,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (_args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           const vaults = await op.listVaults();
           return JSON.stringify(vaults, null, 2);
         } catch (error) {
@@ -50,11 +60,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           const vault = await op.getVault(args.vaultId);
           return JSON.stringify(vault, null, 2);
         } catch (error) {
@@ -71,11 +77,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           const items = await op.listItems(args.vaultId);
           return JSON.stringify(items, null, 2);
         } catch (error) {
@@ -93,11 +95,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           const item = await op.getItem(args.vaultId, args.itemId);
           return JSON.stringify(item, null, 2);
         } catch (error) {
@@ -117,11 +115,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           const items = await op.listItems(args.vaultId);
           const index = await createIndex(items as unknown as Record<string, unknown>[], {
             maxResults: 20,
@@ -198,11 +192,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
 
           const itemBuilder = new ItemBuilder()
             .setTitle(args.title)
@@ -284,11 +274,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
 
           const existingItem = await op.getItem(args.vaultId, args.itemId);
 
@@ -321,11 +307,7 @@ export const OnePasswordConnectorConfig = mcpConnectorConfig({
       handler: async (args, context) => {
         try {
           const { serverUrl, token } = await context.getCredentials();
-          const op = OnePasswordConnect({
-            serverURL: serverUrl,
-            token,
-            keepAlive: true,
-          });
+          const op = getClient(serverUrl, token);
           await op.deleteItem(args.vaultId, args.itemId);
           return 'Item deleted successfully';
         } catch (error) {
@@ -22,6 +22,8 @@ interface ReplicateClient {
   };
 }
 
+const POLL_INTERVAL_MS = 1000;
+
 // Simple Replicate client implementation
 class SimpleReplicateClient implements ReplicateClient {
   constructor(private apiToken: string) {}
@@ -35,10 +37,14 @@ class SimpleReplicateClient implements ReplicateClient {
       input: options.input,
     });
 
-    // Poll for completion
+    // Poll for completion on a fixed cadence measured from the start, so request
+    // latency does not stretch the interval; ticks missed by a slow request are skipped
+    const start = performance.now();
     let result = prediction;
     while (result.status === 'starting' || result.status === 'processing') {
-      await new Promise((resolve) => setTimeout(resolve, 1000));
+      const elapsed = performance.now() - start;
+      const nextTick = (Math.floor(elapsed / POLL_INTERVAL_MS) + 1) * POLL_INTERVAL_MS;
+      await new Promise((resolve) => setTimeout(resolve, nextTick - elapsed));
       result = await this.predictions.get(result.id);
     }
 
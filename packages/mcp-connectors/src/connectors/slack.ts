@@ -1,5 +1,13 @@
 import { mcpConnectorConfig } from '@stackone/mcp-config-types';
 import { z } from 'zod';
+import { mapWithConcurrency } from '../utils/concurrency';
+
+// conversations.info is a Tier 3 method, so predefined channels are looked up a few
+// at a time and rate-limited replies are retried rather than dropped. Each wait is
+// capped so a long Retry-After fails the listing instead of stalling the request
+const CHANNEL_INFO_CONCURRENCY = 4;
+const MAX_RATE_LIMIT_RETRIES = 2;
+const MAX_RETRY_AFTER_SECONDS = 5;
 
 interface SlackChannel {
   id: string;
@@ -97,6 +105,35 @@ class SlackClient {
     };
   }
 
+  private async getChannelInfo(channelId: string): Promise<SlackChannelInfoResponse> {
+    const params = new URLSearchParams({
+      channel: channelId,
+    });
+
+    for (let attempt = 0; ; attempt++) {
+      const response = await fetch(`https://slack.com/api/conversations.info?${params}`, {
+        headers: this.botHeaders,
+      });
+      const data = (await response.json()) as SlackChannelInfoResponse;
+
+      if (data.ok || data.error !== 'ratelimited') {
+        return data;
+      }
+
+      if (attempt >= MAX_RATE_LIMIT_RETRIES) {
+        throw new Error(`Slack rate limited the lookup of channel ${channelId}`);
+      }
+
+      // Slack sends the wait in seconds via Retry-After
+      const retryAfter = Number(response.headers.get('Retry-After') ?? 1);
+      const waitSeconds = Math.min(
+        Number.isNaN(retryAfter) ? 1 : retryAfter,
+        MAX_RETRY_AFTER_SECONDS
+      );
+      await new Promise((resolve) => setTimeout(resolve, waitSeconds * 1000));
+    }
+  }
+
   async getChannels(limit = 100, cursor?: string): Promise<SlackListChannelsResponse> {
     const predefinedChannelIds = this.channelIds;
     if (!predefinedChannelIds) {
@@ -118,21 +155,24 @@ class SlackClient {
       return response.json() as Promise<SlackListChannelsResponse>;
     }
 
-    const predefinedChannelIdsArray = predefinedChannelIds
-      .split(',')
-      .map((id: string) => id.trim());
-    const channels: SlackChannel[] = [];
-
-    for (const channelId of predefinedChannelIdsArray) {
-      const params = new URLSearchParams({
-        channel: channelId,
-      });
+    // Skip blanks and repeats so each channel is looked up once, in first-seen order
+    const predefinedChannelIdsArray = [
+      ...new Set(
+        predefinedChannelIds
+          .split(',')
+          .map((id: string) => id.trim())
+          .filter(Boolean)
+      ),
+    ];
 
-      const response = await fetch(`https://slack.com/api/conversations.info?${params}`, {
-        headers: this.botHeaders,
-      });
-      const data = (await response.json()) as SlackChannelInfoResponse;
+    const responses = await mapWithConcurrency(
+      predefinedChannelIdsArray,
+      CHANNEL_INFO_CONCURRENCY,
+      (channelId) => this.getChannelInfo(channelId)
+    );
 
+    const channels: SlackChannel[] = [];
+    for (const data of responses) {
       if (data.ok && data.channel && !data.channel.is_archived) {
         channels.push(data.channel);
       }
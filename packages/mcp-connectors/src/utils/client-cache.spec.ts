@@ -0,0 +1,44 @@
+import { describe, expect, it, vi } from 'vitest';
+import { createClientCache } from './client-cache';
+
+describe('#client-cache', () => {
+  describe('.get', () => {
+    describe('when the key is requested twice', () => {
+      it('creates the client once and returns the same instance', () => {
+        const cache = createClientCache<object>();
+        const create = vi.fn(() => ({}));
+
+        const first = cache.get('key', create);
+        const actual = cache.get('key', create);
+
+        expect(actual).toBe(first);
+        expect(create).toHaveBeenCalledTimes(1);
+      });
+    });
+
+    describe('when the cache is full', () => {
+      it('evicts the oldest client', () => {
+        const cache = createClientCache<object>(2);
+        const oldest = cache.get('a', () => ({}));
+        cache.get('b', () => ({}));
+        cache.get('c', () => ({}));
+
+        const actual = cache.get('a', () => ({}));
+
+        expect(actual).not.toBe(oldest);
+      });
+    });
+  });
+
+  describe('.clear', () => {
+    it('drops cached clients', () => {
+      const cache = createClientCache<object>();
+      const first = cache.get('key', () => ({}));
+
+      cache.clear();
+      const actual = cache.get('key', () => ({}));
+
+      expect(actual).not.toBe(first);
+    });
+  });
+});
@@ -0,0 +1,41 @@
+/**
+ * Bounded cache for reusing API clients (and their HTTP connection pools) across tool calls
+ */
+
+export interface ClientCache<C> {
+  /**
+   * Returns the client cached under key, creating it on first use
+   */
+  get(key: string, create: () => C): C;
+
+  /**
+   * Drops every cached client
+   */
+  clear(): void;
+}
+
+/**
+ * Creates a client cache holding at most maxClients entries
+ * The oldest entry is evicted first once the cache is full
+ */
+export const createClientCache = <C>(maxClients = 32): ClientCache<C> => {
+  const clients = new Map<string, C>();
+
+  return {
+    get(key, create) {
+      let client = clients.get(key);
+      if (!client) {
+        if (clients.size >= maxClients) {
+          const oldestKey = clients.keys().next().value;
+          if (oldestKey !== undefined) clients.delete(oldestKey);
+        }
+        client = create();
+        clients.set(key, client);
+      }
+      return client;
+    },
+    clear() {
+      clients.clear();
+    },
+  };
+};
@@ -0,0 +1,63 @@
+import { describe, expect, it, vi } from 'vitest';
+import { mapWithConcurrency } from './concurrency';
+
+const delay = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+describe('#concurrency', () => {
+  describe('.mapWithConcurrency', () => {
+    describe('when items array is empty', () => {
+      it('returns an empty array without calling fn', async () => {
+        const fn = vi.fn();
+
+        const actual = await mapWithConcurrency([], 3, fn);
+
+        expect(actual).toEqual([]);
+        expect(fn).not.toHaveBeenCalled();
+      });
+    });
+
+    describe('when calls finish out of order', () => {
+      it('returns results in input order', async () => {
+        const actual = await mapWithConcurrency([30, 10, 20], 3, async (ms) => {
+          await delay(ms);
+          return ms;
+        });
+
+        expect(actual).toEqual([30, 10, 20]);
+      });
+    });
+
+    describe('when there are more items than the limit', () => {
+      it('never runs more than limit calls at once', async () => {
+        let inFlight = 0;
+        let maxInFlight = 0;
+
+        await mapWithConcurrency(Array.from({ length: 10 }), 3, async () => {
+          inFlight++;
+          maxInFlight = Math.max(maxInFlight, inFlight);
+          await delay(5);
+          inFlight--;
+        });
+
+        expect(maxInFlight).toBe(3);
+      });
+    });
+
+    describe('when a call rejects', () => {
+      it('rejects and stops starting new calls', async () => {
+        const fn = vi.fn(async (item: number) => {
+          await delay(5);
+          if (item === 0) throw new Error('boom');
+          return item;
+        });
+
+        await expect(mapWithConcurrency([0, 1, 2, 3, 4, 5], 2, fn)).rejects.toThrow(
+          'boom'
+        );
+        await delay(20);
+
+        expect(fn.mock.calls.length).toBeLessThan(6);
+      });
+    });
+  });
+});
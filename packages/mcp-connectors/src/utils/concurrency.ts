@@ -0,0 +1,33 @@
+/**
+ * Concurrency helpers for fanning out API calls without bursting past rate limits
+ */
+
+/**
+ * Maps over items with at most `limit` calls to `fn` in flight at once
+ * Results keep the input order, like Promise.all; the first rejection stops new calls
+ */
+export const mapWithConcurrency = async <T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> => {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index] as T, index);
+      } catch (error) {
+        // stop the other workers from picking up further items
+        next = items.length;
+        throw error;
+      }
+    }
+  };
+
+  const workerCount = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+};
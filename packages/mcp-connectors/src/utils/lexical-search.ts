@@ -71,10 +71,10 @@ export interface SearchOptions {
 }
 
 /**
- * Gets a nested value from an object using dot notation
+ * Gets a nested value from an object using a dot notation path split into segments
  */
-function getNestedValue(obj: SearchableItem, path: string): unknown {
-  return path.split('.').reduce((current: unknown, key: string) => {
+function getNestedValue(obj: SearchableItem, segments: string[]): unknown {
+  return segments.reduce((current: unknown, key: string) => {
     if (current && typeof current === 'object' && key in current) {
       return (current as Record<string, unknown>)[key];
     }
@@ -128,23 +128,14 @@ export const createIndex = async <T extends SearchableItem>(
 ): Promise<SearchIndex<T>> => {
   const startTime = Date.now();
 
-  console.log(`[createIndex] Creating search index for ${items.length} items`, {
-    fieldsToSearch: options.fields || 'all',
-  });
-
   try {
     const searchableFields = options.fields || getAllStringFields(items[0] || {});
-    console.log(
-      `[createIndex] Discovered ${searchableFields.length} searchable fields:`,
-      searchableFields
-    );
 
     const schema = {
       id: 'string',
       ...Object.fromEntries(searchableFields.map((field) => [field, 'string'])),
     } as const;
 
-    console.log('[createIndex] Creating Orama database with schema');
     const db = await create({
       schema,
       components: {
@@ -157,28 +148,27 @@ export const createIndex = async <T extends SearchableItem>(
     // Prepare documents and id mapping
     const idMap = new Map<string, T>();
 
+    // Split each field path once rather than once per document
+    const fieldPaths = searchableFields.map(
+      (field) => [field, field.split('.')] as const
+    );
+
     const documents = items.map((item, index) => {
       const id = String(index);
       idMap.set(id, item);
 
       const doc: Record<string, string> = { id };
 
-      for (const field of searchableFields) {
-        const value = getNestedValue(item, field);
+      for (const [field, segments] of fieldPaths) {
+        const value = getNestedValue(item, segments);
         doc[field] = typeof value === 'string' ? value : '';
       }
 
       return doc;
     });
 
-    console.log(
-      `[createIndex] Inserting ${documents.length} documents into Orama database`
-    );
     await insertMultiple(db, documents);
 
-    const duration = Date.now() - startTime;
-    console.log(`[createIndex] Index created in ${duration}ms`);
-
     return {
       db,
       items,
@@ -206,16 +196,7 @@ export const search = async <T extends SearchableItem>(
   const { threshold = 0, maxResults = 50 } = { ...index.options, ...overrideOptions };
   const startTime = Date.now();
 
-  console.log(
-    `[search] Searching for "${query}" in index with ${index.items.length} items`,
-    {
-      threshold,
-      maxResults,
-    }
-  );
-
   if (!query || query.trim() === '') {
-    console.log('[search] Empty query, returning all items with score 0');
     return index.items.map((item) => ({ item, score: 0 }));
   }
 
@@ -224,11 +205,6 @@ export const search = async <T extends SearchableItem>(
     const boost = { ...index.options.boost, ...overrideOptions.boost };
     const sortBy = overrideOptions.sortBy || index.options.sortBy;
 
-    console.log(`[search] Executing search with term: "${query}"`, {
-      boost: Object.keys(boost).length > 0,
-      sortBy,
-    });
-
     const searchParams = {
       term: query,
       properties: (index.options.fields && index.options.fields.length > 0
@@ -264,15 +240,6 @@ export const search = async <T extends SearchableItem>(
       })
       .filter((result): result is SearchResult<T> => result !== null);
 
-    const duration = Date.now() - startTime;
-
-    console.log(`[search] Search completed in ${duration}ms`, {
-      query,
-      itemsSearched: index.items.length,
-      resultsFound: results.length,
-      topScores: results.slice(0, 3).map((r) => r.score),
-    });
-
     return results;
   } catch (error) {
     const duration = Date.now() - startTime;